@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Annotated
 
@@ -15,7 +16,8 @@ if str(SRC_DIR) not in sys.path:
     sys.path.insert(0, str(SRC_DIR))
 
 from db import create_db_engine, create_session_factory
-from domain.pipeline import rebuild_single_system
+from domain.config_base import BaseSystemConfig
+from domain.pipeline import RebuildSummary, rebuild_single_system
 from domain.protocol import Granularity, Subject
 from domain.registry import RatingSystemDescriptor, get, get_all
 
@@ -28,6 +30,32 @@ app = typer.Typer(
 )
 
 
+def _rebuild_config_in_worker(
+    *,
+    algorithm: str,
+    granularity: Granularity,
+    subject: Subject,
+    db_url: str,
+    system_config: BaseSystemConfig,
+    batch_size: int,
+    dry_run: bool,
+) -> RebuildSummary:
+    """Rebuild one config in a worker process with its own engine."""
+    descriptor = get(algorithm, granularity, subject)
+    engine = create_db_engine(db_url)
+    try:
+        return rebuild_single_system(
+            session_factory=create_session_factory(engine),
+            descriptor=descriptor,
+            system_config=system_config,
+            batch_size=batch_size,
+            dry_run=dry_run,
+            echo=typer.echo,
+        )
+    finally:
+        engine.dispose()
+
+
 def rebuild_registered_system(
     *,
     algorithm: str,
@@ -38,10 +66,13 @@ def rebuild_registered_system(
     config_name: str | None,
     batch_size: int,
     dry_run: bool,
+    workers: int = 1,
 ) -> None:
     """Rebuild one registered system for all or one config file."""
     if batch_size <= 0:
         raise typer.BadParameter("--batch-size must be greater than 0")
+    if workers <= 0:
+        raise typer.BadParameter("--workers must be greater than 0")
 
     descriptor = get(algorithm, granularity, subject)
     target_config_dir = config_dir or descriptor.config_dir
@@ -67,15 +98,37 @@ def rebuild_registered_system(
         f"subject={descriptor.subject.value}"
     )
 
-    for config in configs:
-        rebuild_single_system(
-            session_factory=session_factory,
-            descriptor=descriptor,
-            system_config=config,
-            batch_size=batch_size,
-            dry_run=dry_run,
-            echo=typer.echo,
-        )
+    if workers == 1 or len(configs) == 1:
+        for config in configs:
+            rebuild_single_system(
+                session_factory=session_factory,
+                descriptor=descriptor,
+                system_config=config,
+                batch_size=batch_size,
+                dry_run=dry_run,
+                echo=typer.echo,
+            )
+        return
+
+    # Each config is an independent replay of the same map stream, so configs
+    # can be rebuilt side by side; ordering only matters within one config.
+    engine.dispose()
+    with ProcessPoolExecutor(max_workers=min(workers, len(configs))) as executor:
+        futures = [
+            executor.submit(
+                _rebuild_config_in_worker,
+                algorithm=descriptor.algorithm,
+                granularity=descriptor.granularity,
+                subject=descriptor.subject,
+                db_url=db_url,
+                system_config=config,
+                batch_size=batch_size,
+                dry_run=dry_run,
+            )
+            for config in configs
+        ]
+        for future in futures:
+            future.result()
 
 
 @app.command()
@@ -127,6 +180,13 @@ def rebuild(
         bool,
         typer.Option("--dry-run", help="Compute ratings without writing events."),
     ] = False,
+    workers: Annotated[
+        int,
+        typer.Option(
+            "--workers",
+            help="Number of configs to rebuild in parallel worker processes.",
+        ),
+    ] = 1,
 ) -> None:
     """Rebuild one registered rating system."""
     rebuild_registered_system(
@@ -138,6 +198,7 @@ def rebuild(
         config_name=config_name,
         batch_size=batch_size,
         dry_run=dry_run,
+        workers=workers,
     )
 
 
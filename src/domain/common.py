@@ -3,10 +3,10 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import UTC, datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TeamMapResult:
     """Canonical map outcome payload used by rating calculators."""
 
@@ -24,3 +24,15 @@ class TeamMapResult:
     team2_kd_ratio: float | None = None
     is_lan: bool = False
     match_format: str | None = None
+
+
+_NAIVE_EPOCH = datetime(1970, 1, 1)
+_UTC_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+
+def to_epoch_seconds(event_time: datetime) -> float:
+    """Return seconds since the Unix epoch, treating naive datetimes as UTC (no DST shifts)."""
+    # A timedelta subtraction is several times cheaper than replace(tzinfo=...).timestamp().
+    if event_time.tzinfo is None:
+        return (event_time - _NAIVE_EPOCH).total_seconds()
+    return (event_time - _UTC_EPOCH).total_seconds()
@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
+import copy
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Callable, TypeVar
-import tomllib
+import os
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BaseSystemConfig:
     """Minimal metadata shared across all rating-system configs."""
 
@@ -23,6 +24,34 @@ class BaseSystemConfig:
 
 T = TypeVar("T", bound=BaseSystemConfig)
 
+# Parsed TOML keyed by path, stored with the (mtime_ns, size) it was parsed at, so an edited file
+# replaces its own entry. Callers get deep copies so a parser cannot corrupt the cache.
+_PARSE_CACHE: dict[str, tuple[int, int, dict[str, Any]]] = {}
+
+
+def _read_toml(file_path: Path) -> dict[str, Any]:
+    stat_result = file_path.stat()
+    cache_key = str(file_path)
+    cached = _PARSE_CACHE.get(cache_key)
+    if (
+        cached is not None
+        and cached[0] == stat_result.st_mtime_ns
+        and cached[1] == stat_result.st_size
+    ):
+        return copy.deepcopy(cached[2])
+
+    # Imported on first use so entry points that never load configs skip tomllib's import cost.
+    import tomllib
+
+    raw = tomllib.loads(file_path.read_bytes().decode("utf-8"))
+    _PARSE_CACHE[cache_key] = (stat_result.st_mtime_ns, stat_result.st_size, raw)
+    return copy.deepcopy(raw)
+
+
+def clear_config_cache() -> None:
+    """Drop all memoized TOML parse results."""
+    _PARSE_CACHE.clear()
+
 
 def load_system_configs(
     config_dir: Path,
@@ -31,20 +60,27 @@ def load_system_configs(
     duplicate_name_label: str = "rating",
 ) -> list[T]:
     """Load all TOML files in a directory with duplicate-name validation."""
-    if not config_dir.exists():
-        raise FileNotFoundError(f"Config directory not found: {config_dir}")
-    if not config_dir.is_dir():
-        raise NotADirectoryError(f"Config path is not a directory: {config_dir}")
-
-    config_files = sorted(config_dir.glob("*.toml"))
+    # One scandir pass both probes the directory and lists it, using cached dirent types.
+    try:
+        with os.scandir(config_dir) as entries:
+            config_files = sorted(
+                Path(entry.path)
+                for entry in entries
+                if entry.name.endswith(".toml") and entry.is_file()
+            )
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Config directory not found: {config_dir}") from None
+    except NotADirectoryError:
+        raise NotADirectoryError(f"Config path is not a directory: {config_dir}") from None
     if not config_files:
         raise ValueError(f"No .toml config files found in: {config_dir}")
 
-    systems: list[T] = []
-    for file_path in config_files:
-        with file_path.open("rb") as file:
-            raw = tomllib.load(file)
-        systems.append(parser(raw, file_path))
+    # Serial reads: tomllib is pure Python and holds the GIL, so a thread pool only adds startup cost.
+    raw_configs = [_read_toml(file_path) for file_path in config_files]
+
+    systems: list[T] = [
+        parser(raw, file_path) for raw, file_path in zip(raw_configs, config_files)
+    ]
 
     names = [system.name for system in systems]
     if len(names) != len(set(names)):
@@ -55,4 +91,4 @@ def load_system_configs(
     return systems
 
 
-__all__ = ["BaseSystemConfig", "load_system_configs"]
+__all__ = ["BaseSystemConfig", "clear_config_cache", "load_system_configs"]
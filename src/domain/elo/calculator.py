@@ -6,7 +6,7 @@ from dataclasses import dataclass
 from datetime import UTC, datetime
 from math import exp, log
 
-from domain.common import TeamMapResult
+from domain.common import TeamMapResult, to_epoch_seconds
 
 
 @dataclass(frozen=True)
@@ -28,7 +28,7 @@ class EloParameters:
     bo5_match_multiplier: float = 1.0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TeamEloEvent:
     team_id: int
     opponent_team_id: int
@@ -49,7 +49,12 @@ class TeamEloEvent:
 
 def calculate_expected_score(rating: float, opponent_rating: float, scale_factor: float) -> float:
     """Compute the Elo expected score for one side."""
-    return 1.0 / (1.0 + 10.0 ** ((opponent_rating - rating) / scale_factor))
+    return _expected_score(rating, opponent_rating, log(10.0) / scale_factor)
+
+
+def _expected_score(rating: float, opponent_rating: float, exponent: float) -> float:
+    # 10 ** (x / scale) == exp(x * ln(10) / scale); callers fold ln(10) / scale into exponent.
+    return 1.0 / (1.0 + exp((opponent_rating - rating) * exponent))
 
 
 class TeamEloCalculator:
@@ -66,11 +71,33 @@ class TeamEloCalculator:
         self.lookback_days = lookback_days if lookback_days is not None and lookback_days > 0 else None
         self.as_of_time = as_of_time or datetime.now(UTC).replace(tzinfo=None)
         self._ratings: dict[int, float] = {}
-        self._last_event_times: dict[int, datetime] = {}
+        self._last_event_timestamps: dict[int, float] = {}
+        self._round_domination_lut: dict[tuple[int, int], float] = {}
         if self.params.inactivity_half_life_days > 0.0:
-            self._inactivity_decay_lambda = log(2.0) / self.params.inactivity_half_life_days
+            # Decay rate per second of inactivity, so no day conversion is needed per map.
+            self._inactivity_decay_per_second = log(2.0) / (
+                self.params.inactivity_half_life_days * 86_400.0
+            )
         else:
-            self._inactivity_decay_lambda = 0.0
+            self._inactivity_decay_per_second = 0.0
+        # ln(10) / scale for _expected_score, folded once per calculator.
+        self._expected_score_exponent = log(10.0) / self.params.scale_factor
+        self._format_multipliers: dict[str | None, float] = {
+            "BO5": self.params.bo5_match_multiplier,
+            "BO3": self.params.bo3_match_multiplier,
+            "BO1": self.params.bo1_match_multiplier,
+        }
+        if self.lookback_days is None or self.params.recency_min_multiplier == 1.0:
+            self._recency_loss_per_day = 0.0
+        else:
+            self._recency_loss_per_day = (1.0 - self.params.recency_min_multiplier) / float(
+                self.lookback_days
+            )
+        self._as_of_timestamp = to_epoch_seconds(self.as_of_time)
+        # Event timestamps only feed inactivity decay and recency weighting.
+        self._uses_event_timestamps = (
+            self._inactivity_decay_per_second > 0.0 or self._recency_loss_per_day != 0.0
+        )
 
     def get_rating(self, team_id: int) -> float:
         return self._ratings.get(team_id, self.params.initial_elo)
@@ -86,30 +113,25 @@ class TeamEloCalculator:
         """Return a snapshot of current team ratings."""
         return dict(self._ratings)
 
-    def _apply_inactivity_decay(self, *, team_id: int, event_time: datetime) -> float:
-        rating = self.get_rating(team_id)
-        if self._inactivity_decay_lambda <= 0.0:
+    def _apply_inactivity_decay(self, *, team_id: int, event_timestamp: float) -> float:
+        initial_elo = self.params.initial_elo
+        rating = self._ratings.get(team_id, initial_elo)
+        if self._inactivity_decay_per_second <= 0.0:
             return rating
 
-        last_event_time = self._last_event_times.get(team_id)
-        if last_event_time is None:
+        last_event_timestamp = self._last_event_timestamps.get(team_id)
+        if last_event_timestamp is None:
             return rating
 
-        inactive_days = (event_time - last_event_time).total_seconds() / 86_400.0
-        if inactive_days <= 0.0:
+        inactive_seconds = event_timestamp - last_event_timestamp
+        if inactive_seconds <= 0.0:
             return rating
 
-        decay_factor = exp(-self._inactivity_decay_lambda * inactive_days)
-        return self.params.initial_elo + ((rating - self.params.initial_elo) * decay_factor)
+        decay_factor = exp(-self._inactivity_decay_per_second * inactive_seconds)
+        return initial_elo + ((rating - initial_elo) * decay_factor)
 
     def _format_multiplier(self, match_format: str | None) -> float:
-        if match_format == "BO5":
-            return self.params.bo5_match_multiplier
-        if match_format == "BO3":
-            return self.params.bo3_match_multiplier
-        if match_format == "BO1":
-            return self.params.bo1_match_multiplier
-        return 1.0
+        return self._format_multipliers.get(match_format, 1.0)
 
     def _winner_outcome_multiplier(self, *, winner_pre_elo: float, loser_pre_elo: float) -> float:
         if winner_pre_elo > loser_pre_elo:
@@ -134,11 +156,23 @@ class TeamEloCalculator:
 
         team1_score = max(map_result.team1_score, 0)
         team2_score = max(map_result.team2_score, 0)
-        total_rounds = team1_score + team2_score
+        if map_result.winner_id == map_result.team1_id:
+            round_key = (team1_score, team2_score)
+        else:
+            round_key = (team2_score, team1_score)
+
+        # Round scores come from a small integer domain, so each score line is computed once.
+        multiplier = self._round_domination_lut.get(round_key)
+        if multiplier is None:
+            multiplier = self._compute_round_domination_multiplier(*round_key)
+            self._round_domination_lut[round_key] = multiplier
+        return multiplier
+
+    def _compute_round_domination_multiplier(self, winner_score: int, loser_score: int) -> float:
+        total_rounds = winner_score + loser_score
         if total_rounds <= 0:
             return 1.0
 
-        winner_score = team1_score if map_result.winner_id == map_result.team1_id else team2_score
         winner_share = winner_score / total_rounds
         domination_index = max(0.0, min((winner_share - 0.5) / 0.5, 1.0))
         return 1.0 + ((self.params.round_domination_multiplier - 1.0) * domination_index)
@@ -167,55 +201,76 @@ class TeamEloCalculator:
         domination_index = min(kd_ratio_gap, 1.0)
         return 1.0 + ((self.params.kd_ratio_domination_multiplier - 1.0) * domination_index)
 
-    def _recency_multiplier(self, event_time: datetime) -> float:
-        if self.lookback_days is None or self.params.recency_min_multiplier == 1.0:
+    def _recency_multiplier(self, event_timestamp: float) -> float:
+        if self._recency_loss_per_day == 0.0:
             return 1.0
 
-        age_days = (self.as_of_time - event_time).total_seconds() / 86_400.0
-        age_fraction = max(0.0, min(age_days / float(self.lookback_days), 1.0))
-        return 1.0 - ((1.0 - self.params.recency_min_multiplier) * age_fraction)
+        age_days = (self._as_of_timestamp - event_timestamp) / 86_400.0
+        age_days = max(0.0, min(age_days, float(self.lookback_days)))
+        return 1.0 - (self._recency_loss_per_day * age_days)
 
     def process_map(self, map_result: TeamMapResult) -> tuple[TeamEloEvent, TeamEloEvent]:
-        if map_result.team1_id == map_result.team2_id:
-            raise ValueError(
-                f"map_id={map_result.map_id} has identical teams ({map_result.team1_id})"
-            )
+        (
+            match_id,
+            map_id,
+            map_number,
+            event_time,
+            team1_id,
+            team2_id,
+            winner_id,
+            is_lan,
+            match_format,
+        ) = (
+            map_result.match_id,
+            map_result.map_id,
+            map_result.map_number,
+            map_result.event_time,
+            map_result.team1_id,
+            map_result.team2_id,
+            map_result.winner_id,
+            map_result.is_lan,
+            map_result.match_format,
+        )
+        params = self.params
+
+        if team1_id == team2_id:
+            raise ValueError(f"map_id={map_id} has identical teams ({team1_id})")
 
-        if map_result.winner_id not in (map_result.team1_id, map_result.team2_id):
+        if winner_id not in (team1_id, team2_id):
             raise ValueError(
-                f"winner_id={map_result.winner_id} does not belong to map teams "
-                f"{map_result.team1_id}/{map_result.team2_id} for map_id={map_result.map_id}"
+                f"winner_id={winner_id} does not belong to map teams "
+                f"{team1_id}/{team2_id} for map_id={map_id}"
             )
 
-        team1_pre = self._apply_inactivity_decay(team_id=map_result.team1_id, event_time=map_result.event_time)
-        team2_pre = self._apply_inactivity_decay(team_id=map_result.team2_id, event_time=map_result.event_time)
+        event_timestamp = to_epoch_seconds(event_time) if self._uses_event_timestamps else 0.0
+        team1_pre = self._apply_inactivity_decay(team_id=team1_id, event_timestamp=event_timestamp)
+        team2_pre = self._apply_inactivity_decay(team_id=team2_id, event_timestamp=event_timestamp)
 
-        team1_expected = calculate_expected_score(
-            rating=team1_pre,
-            opponent_rating=team2_pre,
-            scale_factor=self.params.scale_factor,
-        )
+        team1_expected = _expected_score(team1_pre, team2_pre, self._expected_score_exponent)
         team2_expected = 1.0 - team1_expected
 
-        team1_actual = 1.0 if map_result.winner_id == map_result.team1_id else 0.0
+        team1_won = winner_id == team1_id
+        if team1_won:
+            team1_actual = 1.0
+            winner_pre_elo, loser_pre_elo, winner_expected_score = team1_pre, team2_pre, team1_expected
+        else:
+            team1_actual = 0.0
+            winner_pre_elo, loser_pre_elo, winner_expected_score = team2_pre, team1_pre, team2_expected
         team2_actual = 1.0 - team1_actual
 
-        winner_pre_elo = team1_pre if team1_actual == 1.0 else team2_pre
-        loser_pre_elo = team2_pre if team1_actual == 1.0 else team1_pre
-        winner_expected_score = team1_expected if team1_actual == 1.0 else team2_expected
         effective_k_multiplier = self._winner_outcome_multiplier(
             winner_pre_elo=winner_pre_elo,
             loser_pre_elo=loser_pre_elo,
         )
         effective_k = (
-            self.params.k_factor
-            * self._format_multiplier(map_result.match_format)
+            params.k_factor
+            * self._format_multiplier(match_format)
             * effective_k_multiplier
             * self._opponent_strength_multiplier(winner_expected_score=winner_expected_score)
-            * (self.params.lan_multiplier if map_result.is_lan else 1.0)
+            * (params.lan_multiplier if is_lan else 1.0)
             * self._round_domination_multiplier(map_result)
             * self._kd_ratio_domination_multiplier(map_result)
-            * self._recency_multiplier(map_result.event_time)
+            * self._recency_multiplier(event_timestamp)
         )
 
         team1_delta = effective_k * (team1_actual - team1_expected)
@@ -224,43 +279,46 @@ class TeamEloCalculator:
         team1_post = team1_pre + team1_delta
         team2_post = team2_pre + team2_delta
 
-        self._ratings[map_result.team1_id] = team1_post
-        self._ratings[map_result.team2_id] = team2_post
-        self._last_event_times[map_result.team1_id] = map_result.event_time
-        self._last_event_times[map_result.team2_id] = map_result.event_time
+        self._ratings[team1_id] = team1_post
+        self._ratings[team2_id] = team2_post
+        if self._uses_event_timestamps:
+            self._last_event_timestamps[team1_id] = event_timestamp
+            self._last_event_timestamps[team2_id] = event_timestamp
 
+        scale_factor = params.scale_factor
+        initial_elo = params.initial_elo
         team1_event = TeamEloEvent(
-            team_id=map_result.team1_id,
-            opponent_team_id=map_result.team2_id,
-            match_id=map_result.match_id,
-            map_id=map_result.map_id,
-            map_number=map_result.map_number,
-            event_time=map_result.event_time,
-            won=bool(team1_actual),
+            team_id=team1_id,
+            opponent_team_id=team2_id,
+            match_id=match_id,
+            map_id=map_id,
+            map_number=map_number,
+            event_time=event_time,
+            won=team1_won,
             actual_score=team1_actual,
             expected_score=team1_expected,
             pre_elo=team1_pre,
             elo_delta=team1_delta,
             post_elo=team1_post,
             k_factor=effective_k,
-            scale_factor=self.params.scale_factor,
-            initial_elo=self.params.initial_elo,
+            scale_factor=scale_factor,
+            initial_elo=initial_elo,
         )
         team2_event = TeamEloEvent(
-            team_id=map_result.team2_id,
-            opponent_team_id=map_result.team1_id,
-            match_id=map_result.match_id,
-            map_id=map_result.map_id,
-            map_number=map_result.map_number,
-            event_time=map_result.event_time,
-            won=bool(team2_actual),
+            team_id=team2_id,
+            opponent_team_id=team1_id,
+            match_id=match_id,
+            map_id=map_id,
+            map_number=map_number,
+            event_time=event_time,
+            won=not team1_won,
             actual_score=team2_actual,
             expected_score=team2_expected,
             pre_elo=team2_pre,
             elo_delta=team2_delta,
             post_elo=team2_post,
             k_factor=effective_k,
-            scale_factor=self.params.scale_factor,
-            initial_elo=self.params.initial_elo,
+            scale_factor=scale_factor,
+            initial_elo=initial_elo,
         )
         return team1_event, team2_event
@@ -5,16 +5,17 @@ from __future__ import annotations
 from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import datetime
-from math import exp, log, pi, sqrt
+from math import exp, log, pi, sqrt, tanh
 from typing import Final
 
-from domain.common import TeamMapResult
+from domain.common import TeamMapResult, to_epoch_seconds
 
 GLICKO2_SCALE: Final[float] = 173.7178
 DEFAULT_RATING: Final[float] = 1500.0
+_THREE_OVER_PI_SQUARED: Final[float] = 3.0 / (pi * pi)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Glicko2Parameters:
     initial_rating: float = 1500.0
     initial_rd: float = 350.0
@@ -26,14 +27,14 @@ class Glicko2Parameters:
     epsilon: float = 1e-6
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Glicko2OpponentResult:
     opponent_rating: float
     opponent_rd: float
     score: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TeamGlicko2Event:
     team_id: int
     opponent_team_id: int
@@ -60,8 +61,10 @@ class TeamGlicko2Event:
     initial_volatility: float
 
 
-@dataclass
+@dataclass(slots=True)
 class _TeamGlicko2State:
+    """Team state on the display scale, so RD bounds are applied exactly in RD space."""
+
     rating: float
     rd: float
     volatility: float
@@ -84,16 +87,16 @@ def _from_phi(phi: float) -> float:
 
 
 def _g(phi: float) -> float:
-    return 1.0 / sqrt(1.0 + ((3.0 * (phi**2)) / (pi**2)))
+    return 1.0 / sqrt(1.0 + (_THREE_OVER_PI_SQUARED * (phi * phi)))
 
 
 def _expected(mu: float, opp_mu: float, opp_phi: float) -> float:
-    exponent = -_g(opp_phi) * (mu - opp_mu)
-    if exponent >= 0.0:
-        exp_term = exp(-exponent)
-        return exp_term / (1.0 + exp_term)
-    exp_term = exp(exponent)
-    return 1.0 / (1.0 + exp_term)
+    return _expected_with_g(mu, opp_mu, _g(opp_phi))
+
+
+def _expected_with_g(mu: float, opp_mu: float, g_term: float) -> float:
+    # logistic(x) == 0.5 * (1 + tanh(x / 2)); tanh cannot overflow, so no sign branch is needed.
+    return 0.5 * (1.0 + tanh(0.5 * g_term * (mu - opp_mu)))
 
 
 def calculate_expected_score(
@@ -120,17 +123,22 @@ def _solve_volatility(
     tau: float,
     epsilon: float,
 ) -> float:
-    a = log(sigma**2)
+    sigma_squared = sigma * sigma
+    a = log(sigma_squared)
+    # Terms that do not depend on x are computed once instead of on every f(x) call.
+    delta_squared = delta * delta
+    phi_squared_plus_v = (phi * phi) + v
+    tau_squared = tau * tau
 
     def f(x: float) -> float:
         ex = exp(x)
-        numerator = ex * ((delta**2) - (phi**2) - v - ex)
-        denominator = 2.0 * ((phi**2) + v + ex) ** 2
-        return (numerator / denominator) - ((x - a) / (tau**2))
+        denominator_root = phi_squared_plus_v + ex
+        numerator = ex * (delta_squared - phi_squared_plus_v - ex)
+        return (numerator / (2.0 * denominator_root * denominator_root)) - ((x - a) / tau_squared)
 
     a_value = a
-    if (delta**2) > ((phi**2) + v):
-        b_value = log((delta**2) - (phi**2) - v)
+    if delta_squared > phi_squared_plus_v:
+        b_value = log(delta_squared - phi_squared_plus_v)
     else:
         k = 1
         b_value = a_value - (k * tau)
@@ -140,7 +148,11 @@ def _solve_volatility(
                 raise RuntimeError("Glicko-2 volatility solve failed to bracket root.")
             b_value = a_value - (k * tau)
 
-    f_a = f(a_value)
+    # f(a) in closed form: exp(a) is sigma^2 and the (x - a) term vanishes.
+    denominator_root_a = phi_squared_plus_v + sigma_squared
+    f_a = (sigma_squared * (delta_squared - phi_squared_plus_v - sigma_squared)) / (
+        2.0 * denominator_root_a * denominator_root_a
+    )
     f_b = f(b_value)
     while abs(b_value - a_value) > epsilon:
         if f_b == f_a:
@@ -175,26 +187,44 @@ def update_glicko2_player(
     mu = _to_mu(rating)
     phi = _to_phi(rd)
 
-    g_terms: list[float] = []
-    e_terms: list[float] = []
-    score_minus_e_terms: list[float] = []
-    for result in results:
-        opp_mu = _to_mu(result.opponent_rating)
-        opp_phi = _to_phi(result.opponent_rd)
-        g_term = _g(opp_phi)
-        expected = _expected(mu, opp_mu, opp_phi)
-        g_terms.append(g_term)
-        e_terms.append(expected)
-        score_minus_e_terms.append(result.score - expected)
+    if len(results) == 1:
+        # Single-opponent period: skip the accumulation loop and g memo.
+        result = results[0]
+        g_term = _g(_to_phi(result.opponent_rd))
+        expected = _expected_with_g(mu, _to_mu(result.opponent_rating), g_term)
+        post = _update_against_one(
+            mu=mu,
+            phi=phi,
+            volatility=volatility,
+            g_term=g_term,
+            expected=expected,
+            score=result.score,
+            tau=tau,
+            epsilon=epsilon,
+        )
+        if post is None:
+            return rating, rd, volatility
+        mu_prime, phi_prime, sigma_prime = post
+        return _from_mu(mu_prime), _from_phi(phi_prime), sigma_prime
 
+    # One pass accumulates both sums the update needs: v^-1 and sum(g * (s - E)).
+    # g(phi_j) depends only on the opponent's RD, so repeat opponents reuse it.
     v_inverse = 0.0
-    for g_term, expected in zip(g_terms, e_terms):
-        v_inverse += (g_term**2) * expected * (1.0 - expected)
+    weighted_score_sum = 0.0
+    g_by_opponent_rd: dict[float, float] = {}
+    for result in results:
+        g_term = g_by_opponent_rd.get(result.opponent_rd)
+        if g_term is None:
+            g_term = _g(_to_phi(result.opponent_rd))
+            g_by_opponent_rd[result.opponent_rd] = g_term
+        expected = _expected_with_g(mu, _to_mu(result.opponent_rating), g_term)
+        v_inverse += g_term * g_term * expected * (1.0 - expected)
+        weighted_score_sum += g_term * (result.score - expected)
     if v_inverse <= 0.0:
         return rating, rd, volatility
 
     v = 1.0 / v_inverse
-    delta = v * sum(g_term * score_minus_e for g_term, score_minus_e in zip(g_terms, score_minus_e_terms))
+    delta = v * weighted_score_sum
     sigma_prime = _solve_volatility(
         phi=phi,
         sigma=volatility,
@@ -204,34 +234,129 @@ def update_glicko2_player(
         epsilon=epsilon,
     )
 
-    phi_star = sqrt((phi**2) + (sigma_prime**2))
-    phi_prime = 1.0 / sqrt((1.0 / (phi_star**2)) + (1.0 / v))
-    mu_prime = mu + (phi_prime**2) * sum(
-        g_term * score_minus_e for g_term, score_minus_e in zip(g_terms, score_minus_e_terms)
-    )
+    phi_star_squared = (phi * phi) + (sigma_prime * sigma_prime)
+    phi_prime = 1.0 / sqrt((1.0 / phi_star_squared) + v_inverse)
+    mu_prime = mu + (phi_prime * phi_prime) * weighted_score_sum
 
     return _from_mu(mu_prime), _from_phi(phi_prime), sigma_prime
 
 
+def _update_against_one(
+    *,
+    mu: float,
+    phi: float,
+    volatility: float,
+    g_term: float,
+    expected: float,
+    score: float,
+    tau: float,
+    epsilon: float,
+) -> tuple[float, float, float] | None:
+    """Glicko-2 step for one opponent with g(phi_j) and E already known, on the mu/phi scale.
+
+    Returns ``None`` when the result carries no information (``v^-1 <= 0``).
+    """
+    v_inverse = g_term * g_term * expected * (1.0 - expected)
+    if v_inverse <= 0.0:
+        return None
+
+    v = 1.0 / v_inverse
+    weighted_score = g_term * (score - expected)
+    sigma_prime = _solve_volatility(
+        phi=phi,
+        sigma=volatility,
+        delta=v * weighted_score,
+        v=v,
+        tau=tau,
+        epsilon=epsilon,
+    )
+
+    phi_star_squared = (phi * phi) + (sigma_prime * sigma_prime)
+    phi_prime = 1.0 / sqrt((1.0 / phi_star_squared) + v_inverse)
+    mu_prime = mu + (phi_prime * phi_prime) * weighted_score
+    return mu_prime, phi_prime, sigma_prime
+
+
+def _update_pair(
+    *,
+    mu1: float,
+    phi1: float,
+    volatility1: float,
+    mu2: float,
+    phi2: float,
+    volatility2: float,
+    score1: float,
+    tau: float,
+    epsilon: float,
+) -> tuple[tuple[float, float, float, float], tuple[float, float, float, float]]:
+    """Update both sides of one head-to-head, sharing g(phi) and E between expectation and update.
+
+    Returns ``(post_mu, post_phi, post_volatility, expected_score)`` for each side.
+    """
+    # Each side is weighted by its opponent's deviation, so E2 != 1 - E1 in general.
+    g1 = _g(phi2)
+    g2 = _g(phi1)
+    expected1 = _expected_with_g(mu1, mu2, g1)
+    expected2 = _expected_with_g(mu2, mu1, g2)
+
+    post1 = _update_against_one(
+        mu=mu1,
+        phi=phi1,
+        volatility=volatility1,
+        g_term=g1,
+        expected=expected1,
+        score=score1,
+        tau=tau,
+        epsilon=epsilon,
+    ) or (mu1, phi1, volatility1)
+    post2 = _update_against_one(
+        mu=mu2,
+        phi=phi2,
+        volatility=volatility2,
+        g_term=g2,
+        expected=expected2,
+        score=1.0 - score1,
+        tau=tau,
+        epsilon=epsilon,
+    ) or (mu2, phi2, volatility2)
+    return (*post1, expected1), (*post2, expected2)
+
+
 class TeamGlicko2Calculator:
     """Stateful map-by-map team Glicko-2 calculator."""
 
     def __init__(self, params: Glicko2Parameters) -> None:
         self.params = params
         self._states: dict[int, _TeamGlicko2State] = {}
-        self._last_event_times: dict[int, datetime] = {}
+        self._last_event_timestamps: dict[int, float] = {}
+        self._min_rd = self.params.min_rd
+        self._max_rd = self.params.max_rd
+        # Parameters read on every map are cached once instead of going through self.params.
+        self._tau = self.params.tau
+        self._epsilon = self.params.epsilon
+        self._rating_period_days = self.params.rating_period_days
+        # Rating periods per second of inactivity, so no day conversion is needed per map.
+        self._rating_periods_per_second = 1.0 / (self.params.rating_period_days * 86_400.0)
+        self._initial_rating = self.params.initial_rating
+        self._initial_rd = self.params.initial_rd
+        self._initial_volatility = self.params.initial_volatility
 
     def _clamp_rd(self, rd: float) -> float:
-        return max(self.params.min_rd, min(rd, self.params.max_rd))
+        # Branch form of max(min_rd, min(rd, max_rd)) without the two builtin calls.
+        if rd > self._max_rd:
+            return self._max_rd
+        if rd >= self._min_rd:
+            return rd
+        return self._min_rd
 
     def _get_or_create_state(self, team_id: int) -> _TeamGlicko2State:
         existing = self._states.get(team_id)
         if existing is not None:
             return existing
         state = _TeamGlicko2State(
-            rating=self.params.initial_rating,
-            rd=self._clamp_rd(self.params.initial_rd),
-            volatility=self.params.initial_volatility,
+            rating=self._initial_rating,
+            rd=self._clamp_rd(self._initial_rd),
+            volatility=self._initial_volatility,
         )
         self._states[team_id] = state
         return state
@@ -262,22 +387,20 @@ class TeamGlicko2Calculator:
         team_id: int,
         rd: float,
         volatility: float,
-        event_time: datetime,
+        event_timestamp: float,
     ) -> float:
-        last_event_time = self._last_event_times.get(team_id)
-        if last_event_time is None:
+        last_event_timestamp = self._last_event_timestamps.get(team_id)
+        if last_event_timestamp is None:
             return self._clamp_rd(rd)
 
-        inactive_days = (event_time - last_event_time).total_seconds() / 86_400.0
-        if inactive_days <= 0.0:
+        inactive_seconds = event_timestamp - last_event_timestamp
+        if inactive_seconds <= 0.0:
             return self._clamp_rd(rd)
 
-        inactive_periods = inactive_days / self.params.rating_period_days
-        if inactive_periods <= 0.0:
-            return self._clamp_rd(rd)
+        inactive_periods = inactive_seconds * self._rating_periods_per_second
 
         phi = _to_phi(rd)
-        inflated_phi = sqrt((phi**2) + ((volatility**2) * inactive_periods))
+        inflated_phi = sqrt((phi * phi) + ((volatility * volatility) * inactive_periods))
         return self._clamp_rd(_from_phi(inflated_phi))
 
     def process_map(self, map_result: TeamMapResult) -> tuple[TeamGlicko2Event, TeamGlicko2Event]:
@@ -291,6 +414,7 @@ class TeamGlicko2Calculator:
                 f"{map_result.team1_id}/{map_result.team2_id} for map_id={map_result.map_id}"
             )
 
+        event_timestamp = to_epoch_seconds(map_result.event_time)
         team1_state = self._get_or_create_state(map_result.team1_id)
         team2_state = self._get_or_create_state(map_result.team2_id)
 
@@ -302,75 +426,49 @@ class TeamGlicko2Calculator:
             team_id=map_result.team1_id,
             rd=team1_state.rd,
             volatility=team1_state.volatility,
-            event_time=map_result.event_time,
+            event_timestamp=event_timestamp,
         )
         team2_pre_rd = self._inflate_rd_for_inactivity(
             team_id=map_result.team2_id,
             rd=team2_state.rd,
             volatility=team2_state.volatility,
-            event_time=map_result.event_time,
+            event_timestamp=event_timestamp,
         )
 
-        team1_actual = 1.0 if map_result.winner_id == map_result.team1_id else 0.0
+        team1_won = map_result.winner_id == map_result.team1_id
+        team1_actual = 1.0 if team1_won else 0.0
         team2_actual = 1.0 - team1_actual
 
-        team1_expected = calculate_expected_score(
-            rating=team1_pre_rating,
-            rd=team1_pre_rd,
-            opponent_rating=team2_pre_rating,
-            opponent_rd=team2_pre_rd,
-        )
-        team2_expected = calculate_expected_score(
-            rating=team2_pre_rating,
-            rd=team2_pre_rd,
-            opponent_rating=team1_pre_rating,
-            opponent_rd=team1_pre_rd,
+        (
+            (team1_post_mu, team1_post_phi, team1_post_vol, team1_expected),
+            (team2_post_mu, team2_post_phi, team2_post_vol, team2_expected),
+        ) = _update_pair(
+            mu1=_to_mu(team1_pre_rating),
+            phi1=_to_phi(team1_pre_rd),
+            volatility1=team1_pre_vol,
+            mu2=_to_mu(team2_pre_rating),
+            phi2=_to_phi(team2_pre_rd),
+            volatility2=team2_pre_vol,
+            score1=team1_actual,
+            tau=self._tau,
+            epsilon=self._epsilon,
         )
 
-        team1_post_rating, team1_post_rd, team1_post_vol = update_glicko2_player(
-            rating=team1_pre_rating,
-            rd=team1_pre_rd,
-            volatility=team1_pre_vol,
-            results=[
-                Glicko2OpponentResult(
-                    opponent_rating=team2_pre_rating,
-                    opponent_rd=team2_pre_rd,
-                    score=team1_actual,
-                )
-            ],
-            tau=self.params.tau,
-            epsilon=self.params.epsilon,
-        )
-        team2_post_rating, team2_post_rd, team2_post_vol = update_glicko2_player(
-            rating=team2_pre_rating,
-            rd=team2_pre_rd,
-            volatility=team2_pre_vol,
-            results=[
-                Glicko2OpponentResult(
-                    opponent_rating=team1_pre_rating,
-                    opponent_rd=team1_pre_rd,
-                    score=team2_actual,
-                )
-            ],
-            tau=self.params.tau,
-            epsilon=self.params.epsilon,
-        )
-
-        team1_post_rd = self._clamp_rd(team1_post_rd)
-        team2_post_rd = self._clamp_rd(team2_post_rd)
-
-        self._states[map_result.team1_id] = _TeamGlicko2State(
-            rating=team1_post_rating,
-            rd=team1_post_rd,
-            volatility=team1_post_vol,
-        )
-        self._states[map_result.team2_id] = _TeamGlicko2State(
-            rating=team2_post_rating,
-            rd=team2_post_rd,
-            volatility=team2_post_vol,
-        )
-        self._last_event_times[map_result.team1_id] = map_result.event_time
-        self._last_event_times[map_result.team2_id] = map_result.event_time
+        # Convert back before clamping so RD lands exactly on [min_rd, max_rd].
+        team1_post_rating = _from_mu(team1_post_mu)
+        team2_post_rating = _from_mu(team2_post_mu)
+        team1_post_rd = self._clamp_rd(_from_phi(team1_post_phi))
+        team2_post_rd = self._clamp_rd(_from_phi(team2_post_phi))
+
+        # Pre-map values are already held in locals, so the stored states are updated in place.
+        team1_state.rating = team1_post_rating
+        team1_state.rd = team1_post_rd
+        team1_state.volatility = team1_post_vol
+        team2_state.rating = team2_post_rating
+        team2_state.rd = team2_post_rd
+        team2_state.volatility = team2_post_vol
+        self._last_event_timestamps[map_result.team1_id] = event_timestamp
+        self._last_event_timestamps[map_result.team2_id] = event_timestamp
 
         team1_event = TeamGlicko2Event(
             team_id=map_result.team1_id,
@@ -379,7 +477,7 @@ class TeamGlicko2Calculator:
             map_id=map_result.map_id,
             map_number=map_result.map_number,
             event_time=map_result.event_time,
-            won=bool(team1_actual),
+            won=team1_won,
             actual_score=team1_actual,
             expected_score=team1_expected,
             pre_rating=team1_pre_rating,
@@ -391,11 +489,11 @@ class TeamGlicko2Calculator:
             post_rating=team1_post_rating,
             post_rd=team1_post_rd,
             post_volatility=team1_post_vol,
-            tau=self.params.tau,
-            rating_period_days=self.params.rating_period_days,
-            initial_rating=self.params.initial_rating,
-            initial_rd=self.params.initial_rd,
-            initial_volatility=self.params.initial_volatility,
+            tau=self._tau,
+            rating_period_days=self._rating_period_days,
+            initial_rating=self._initial_rating,
+            initial_rd=self._initial_rd,
+            initial_volatility=self._initial_volatility,
         )
         team2_event = TeamGlicko2Event(
             team_id=map_result.team2_id,
@@ -404,7 +502,7 @@ class TeamGlicko2Calculator:
             map_id=map_result.map_id,
             map_number=map_result.map_number,
             event_time=map_result.event_time,
-            won=bool(team2_actual),
+            won=not team1_won,
             actual_score=team2_actual,
             expected_score=team2_expected,
             pre_rating=team2_pre_rating,
@@ -416,10 +514,10 @@ class TeamGlicko2Calculator:
             post_rating=team2_post_rating,
             post_rd=team2_post_rd,
             post_volatility=team2_post_vol,
-            tau=self.params.tau,
-            rating_period_days=self.params.rating_period_days,
-            initial_rating=self.params.initial_rating,
-            initial_rd=self.params.initial_rd,
-            initial_volatility=self.params.initial_volatility,
+            tau=self._tau,
+            rating_period_days=self._rating_period_days,
+            initial_rating=self._initial_rating,
+            initial_rd=self._initial_rd,
+            initial_volatility=self._initial_volatility,
         )
         return team1_event, team2_event
@@ -4,13 +4,13 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 from domain.config_base import BaseSystemConfig, load_system_configs
 from domain.glicko2.calculator import Glicko2Parameters
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Glicko2SystemConfig(BaseSystemConfig):
     """Configuration for one Glicko-2 system rebuild."""
 
@@ -75,24 +75,25 @@ def _parse_glicko2_system_config(raw: dict[str, Any], file_path: Path) -> Glicko
     )
 
 
+# (is_invalid, message) pairs checked in order; the first failing rule is reported.
+_PARAMETER_RULES: tuple[tuple[Callable[[Glicko2Parameters], bool], str], ...] = (
+    (lambda p: p.initial_rating <= 0.0, "initial_rating must be > 0"),
+    (lambda p: p.initial_rd <= 0.0, "initial_rd must be > 0"),
+    (lambda p: p.initial_volatility <= 0.0, "initial_volatility must be > 0"),
+    (lambda p: p.tau <= 0.0, "tau must be > 0"),
+    (lambda p: p.rating_period_days <= 0.0, "rating_period_days must be > 0"),
+    (lambda p: p.min_rd <= 0.0, "min_rd must be > 0"),
+    (lambda p: p.max_rd <= 0.0, "max_rd must be > 0"),
+    (lambda p: p.min_rd > p.max_rd, "min_rd must be <= max_rd"),
+    (
+        lambda p: p.initial_rd < p.min_rd or p.initial_rd > p.max_rd,
+        "initial_rd must be between min_rd and max_rd",
+    ),
+    (lambda p: p.epsilon <= 0.0, "epsilon must be > 0"),
+)
+
+
 def _validate_parameters(*, file_path: Path, parameters: Glicko2Parameters) -> None:
-    if parameters.initial_rating <= 0.0:
-        raise ValueError(f"{file_path}: [glicko2].initial_rating must be > 0")
-    if parameters.initial_rd <= 0.0:
-        raise ValueError(f"{file_path}: [glicko2].initial_rd must be > 0")
-    if parameters.initial_volatility <= 0.0:
-        raise ValueError(f"{file_path}: [glicko2].initial_volatility must be > 0")
-    if parameters.tau <= 0.0:
-        raise ValueError(f"{file_path}: [glicko2].tau must be > 0")
-    if parameters.rating_period_days <= 0.0:
-        raise ValueError(f"{file_path}: [glicko2].rating_period_days must be > 0")
-    if parameters.min_rd <= 0.0:
-        raise ValueError(f"{file_path}: [glicko2].min_rd must be > 0")
-    if parameters.max_rd <= 0.0:
-        raise ValueError(f"{file_path}: [glicko2].max_rd must be > 0")
-    if parameters.min_rd > parameters.max_rd:
-        raise ValueError(f"{file_path}: [glicko2].min_rd must be <= max_rd")
-    if parameters.initial_rd < parameters.min_rd or parameters.initial_rd > parameters.max_rd:
-        raise ValueError(f"{file_path}: [glicko2].initial_rd must be between min_rd and max_rd")
-    if parameters.epsilon <= 0.0:
-        raise ValueError(f"{file_path}: [glicko2].epsilon must be > 0")
+    for is_invalid, message in _PARAMETER_RULES:
+        if is_invalid(parameters):
+            raise ValueError(f"{file_path}: [glicko2].{message}")
@@ -4,13 +4,15 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
+from math import sqrt
+from statistics import NormalDist
 
 from openskill.models import PlackettLuce
 
 from domain.common import TeamMapResult
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OpenSkillParameters:
     initial_mu: float = 25.0
     initial_sigma: float = 25.0 / 3.0
@@ -22,7 +24,7 @@ class OpenSkillParameters:
     ordinal_z: float = 3.0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TeamOpenSkillEvent:
     team_id: int
     opponent_team_id: int
@@ -52,6 +54,20 @@ class TeamOpenSkillEvent:
     initial_sigma: float
 
 
+_STANDARD_NORMAL = NormalDist()
+
+
+def _predict_win_two_teams(
+    mu1: float,
+    sigma1: float,
+    mu2: float,
+    sigma2: float,
+    beta: float,
+) -> float:
+    """Probability that team 1 beats team 2, matching ``PlackettLuce.predict_win`` for 1v1 teams."""
+    return _STANDARD_NORMAL.cdf((mu1 - mu2) / sqrt(2.0 * beta * beta + sigma1 * sigma1 + sigma2 * sigma2))
+
+
 class TeamOpenSkillCalculator:
     """Stateful map-by-map team OpenSkill calculator."""
 
@@ -124,20 +140,27 @@ class TeamOpenSkillCalculator:
         team1_pre = self._get_or_create_rating(map_result.team1_id)
         team2_pre = self._get_or_create_rating(map_result.team2_id)
 
-        predicted = self._model.predict_win([[team1_pre], [team2_pre]])
-        team1_expected = float(predicted[0])
-        team2_expected = float(predicted[1])
-
-        team1_actual = 1.0 if map_result.winner_id == map_result.team1_id else 0.0
-        team2_actual = 1.0 - team1_actual
-        ranks = [1, 2] if team1_actual == 1.0 else [2, 1]
-
+        params = self.params
         team1_pre_mu = float(team1_pre.mu)
         team2_pre_mu = float(team2_pre.mu)
         team1_pre_sigma = float(team1_pre.sigma)
         team2_pre_sigma = float(team2_pre.sigma)
-        team1_pre_ordinal = float(team1_pre.ordinal(self.params.ordinal_z))
-        team2_pre_ordinal = float(team2_pre.ordinal(self.params.ordinal_z))
+
+        # Closed form of the two-team prediction; avoids a second model pass before rate().
+        team1_expected = _predict_win_two_teams(
+            team1_pre_mu, team1_pre_sigma, team2_pre_mu, team2_pre_sigma, params.beta
+        )
+        team2_expected = 1.0 - team1_expected
+
+        team1_won = map_result.winner_id == map_result.team1_id
+        team1_actual = 1.0 if team1_won else 0.0
+        team2_actual = 1.0 - team1_actual
+        ranks = [1, 2] if team1_won else [2, 1]
+
+        # ordinal(z) is mu - z * sigma, so it is computed from the floats already extracted.
+        ordinal_z = params.ordinal_z
+        team1_pre_ordinal = team1_pre_mu - ordinal_z * team1_pre_sigma
+        team2_pre_ordinal = team2_pre_mu - ordinal_z * team2_pre_sigma
 
         updated = self._model.rate(
             [[team1_pre], [team2_pre]],
@@ -150,12 +173,19 @@ class TeamOpenSkillCalculator:
         team2_post_mu = float(team2_post.mu)
         team1_post_sigma = float(team1_post.sigma)
         team2_post_sigma = float(team2_post.sigma)
-        team1_post_ordinal = float(team1_post.ordinal(self.params.ordinal_z))
-        team2_post_ordinal = float(team2_post.ordinal(self.params.ordinal_z))
+        team1_post_ordinal = team1_post_mu - ordinal_z * team1_post_sigma
+        team2_post_ordinal = team2_post_mu - ordinal_z * team2_post_sigma
 
         self._ratings[map_result.team1_id] = team1_post
         self._ratings[map_result.team2_id] = team2_post
 
+        beta = params.beta
+        kappa = params.kappa
+        tau = params.tau
+        limit_sigma = params.limit_sigma
+        balance = params.balance
+        initial_mu = params.initial_mu
+        initial_sigma = params.initial_sigma
         team1_event = TeamOpenSkillEvent(
             team_id=map_result.team1_id,
             opponent_team_id=map_result.team2_id,
@@ -163,7 +193,7 @@ class TeamOpenSkillCalculator:
             map_id=map_result.map_id,
             map_number=map_result.map_number,
             event_time=map_result.event_time,
-            won=bool(team1_actual),
+            won=team1_won,
             actual_score=team1_actual,
             expected_score=team1_expected,
             pre_mu=team1_pre_mu,
@@ -175,14 +205,14 @@ class TeamOpenSkillCalculator:
             post_mu=team1_post_mu,
             post_sigma=team1_post_sigma,
             post_ordinal=team1_post_ordinal,
-            beta=self.params.beta,
-            kappa=self.params.kappa,
-            tau=self.params.tau,
-            limit_sigma=self.params.limit_sigma,
-            balance=self.params.balance,
-            ordinal_z=self.params.ordinal_z,
-            initial_mu=self.params.initial_mu,
-            initial_sigma=self.params.initial_sigma,
+            beta=beta,
+            kappa=kappa,
+            tau=tau,
+            limit_sigma=limit_sigma,
+            balance=balance,
+            ordinal_z=ordinal_z,
+            initial_mu=initial_mu,
+            initial_sigma=initial_sigma,
         )
         team2_event = TeamOpenSkillEvent(
             team_id=map_result.team2_id,
@@ -191,7 +221,7 @@ class TeamOpenSkillCalculator:
             map_id=map_result.map_id,
             map_number=map_result.map_number,
             event_time=map_result.event_time,
-            won=bool(team2_actual),
+            won=not team1_won,
             actual_score=team2_actual,
             expected_score=team2_expected,
             pre_mu=team2_pre_mu,
@@ -203,13 +233,13 @@ class TeamOpenSkillCalculator:
             post_mu=team2_post_mu,
             post_sigma=team2_post_sigma,
             post_ordinal=team2_post_ordinal,
-            beta=self.params.beta,
-            kappa=self.params.kappa,
-            tau=self.params.tau,
-            limit_sigma=self.params.limit_sigma,
-            balance=self.params.balance,
-            ordinal_z=self.params.ordinal_z,
-            initial_mu=self.params.initial_mu,
-            initial_sigma=self.params.initial_sigma,
+            beta=beta,
+            kappa=kappa,
+            tau=tau,
+            limit_sigma=limit_sigma,
+            balance=balance,
+            ordinal_z=ordinal_z,
+            initial_mu=initial_mu,
+            initial_sigma=initial_sigma,
         )
         return team1_event, team2_event
@@ -9,6 +9,12 @@ from typing import Any
 from domain.config_base import BaseSystemConfig, load_system_configs
 from domain.openskill.calculator import OpenSkillParameters
 
+_TRUE_STRINGS: frozenset[str] = frozenset({"true", "1", "yes", "on"})
+_FALSE_STRINGS: frozenset[str] = frozenset({"false", "0", "no", "off"})
+
+# Omitted [openskill] keys fall back to the OpenSkillParameters field defaults.
+_DEFAULT_PARAMETERS = OpenSkillParameters()
+
 
 @dataclass(frozen=True)
 class OpenSkillSystemConfig(BaseSystemConfig):
@@ -44,9 +50,9 @@ def _parse_bool(value: Any, *, file_path: Path, key: str) -> bool:
         return value
     if isinstance(value, str):
         normalized = value.strip().lower()
-        if normalized in ("true", "1", "yes", "on"):
+        if normalized in _TRUE_STRINGS:
             return True
-        if normalized in ("false", "0", "no", "off"):
+        if normalized in _FALSE_STRINGS:
             return False
     raise ValueError(f"{file_path}: [openskill].{key} must be a boolean")
 
@@ -66,18 +72,18 @@ def _parse_openskill_system_config(raw: dict[str, Any], file_path: Path) -> Open
     if lookback_days < 0:
         raise ValueError(f"{file_path}: [system].lookback_days must be >= 0")
 
-    limit_sigma_raw = openskill_raw.get("limit_sigma", False)
-    balance_raw = openskill_raw.get("balance", False)
+    limit_sigma_raw = openskill_raw.get("limit_sigma", _DEFAULT_PARAMETERS.limit_sigma)
+    balance_raw = openskill_raw.get("balance", _DEFAULT_PARAMETERS.balance)
 
     parameters = OpenSkillParameters(
-        initial_mu=float(openskill_raw.get("initial_mu", 25.0)),
-        initial_sigma=float(openskill_raw.get("initial_sigma", 25.0 / 3.0)),
-        beta=float(openskill_raw.get("beta", 25.0 / 6.0)),
-        kappa=float(openskill_raw.get("kappa", 0.0001)),
-        tau=float(openskill_raw.get("tau", 25.0 / 300.0)),
+        initial_mu=float(openskill_raw.get("initial_mu", _DEFAULT_PARAMETERS.initial_mu)),
+        initial_sigma=float(openskill_raw.get("initial_sigma", _DEFAULT_PARAMETERS.initial_sigma)),
+        beta=float(openskill_raw.get("beta", _DEFAULT_PARAMETERS.beta)),
+        kappa=float(openskill_raw.get("kappa", _DEFAULT_PARAMETERS.kappa)),
+        tau=float(openskill_raw.get("tau", _DEFAULT_PARAMETERS.tau)),
         limit_sigma=_parse_bool(limit_sigma_raw, file_path=file_path, key="limit_sigma"),
         balance=_parse_bool(balance_raw, file_path=file_path, key="balance"),
-        ordinal_z=float(openskill_raw.get("ordinal_z", 3.0)),
+        ordinal_z=float(openskill_raw.get("ordinal_z", _DEFAULT_PARAMETERS.ordinal_z)),
     )
     _validate_parameters(file_path=file_path, parameters=parameters)
 
@@ -47,6 +47,8 @@ def rebuild_single_system(
         total_results = len(results)
 
         calculator = descriptor.create_calculator(system_config)
+        # Resolve the bound process method once; it is called for every result in the stream.
+        process_fn = getattr(calculator, descriptor.process_method)
         system = descriptor.repository.upsert_system(
             session,
             name=system_config.name,
@@ -62,7 +64,7 @@ def rebuild_single_system(
 
         if dry_run:
             for result in results:
-                _process_result(calculator, descriptor.process_method, result)
+                process_fn(result)
 
             tracked_entities = _tracked_entity_count(calculator)
             if echo is not None:
@@ -94,11 +96,11 @@ def rebuild_single_system(
             descriptor.repository.delete_events_for_system(session, system_id)
 
             for index, result in enumerate(results, start=1):
-                buffered_events.extend(_process_result(calculator, descriptor.process_method, result))
+                buffered_events.extend(process_fn(result))
 
                 if len(buffered_events) >= batch_size:
-                    payload = buffered_events[:]
-                    buffered_events.clear()
+                    # Hand the full buffer off and start a new one instead of copying it.
+                    payload, buffered_events = buffered_events, []
                     descriptor.repository.insert_events(session, payload, system_id=system_id)
                     inserted_events += len(payload)
 
@@ -112,8 +114,7 @@ def rebuild_single_system(
                     )
 
             if buffered_events:
-                payload = buffered_events[:]
-                buffered_events.clear()
+                payload = buffered_events
                 descriptor.repository.insert_events(session, payload, system_id=system_id)
                 inserted_events += len(payload)
 
@@ -151,14 +152,6 @@ def rebuild_single_system(
         )
 
 
-def _process_result(calculator: Any, process_method: str, result: Any) -> list[Any]:
-    process_fn = getattr(calculator, process_method)
-    events = process_fn(result)
-    if isinstance(events, list):
-        return events
-    return list(events)
-
-
 def _tracked_entity_count(calculator: Any) -> int:
     if hasattr(calculator, "tracked_entity_count"):
         return int(calculator.tracked_entity_count())
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import sys
 from datetime import UTC, datetime, timedelta
 
 from sqlalchemy import (
@@ -209,11 +210,16 @@ def fetch_map_results(session: Session, lookback_days: int | None = 365) -> list
         if not isinstance(event_time, datetime):
             raise ValueError(f"map_id={row['map_id']} has invalid event_time={event_time!r}")
 
+        # Only a handful of distinct map names exist; interning keeps one copy per name, not per row.
+        map_name = row["map_name"]
+        if map_name is not None:
+            map_name = sys.intern(map_name)
+
         map_results.append(
             TeamMapResult(
                 match_id=row["match_id"],
                 map_id=row["map_id"],
-                map_name=row["map_name"],
+                map_name=map_name,
                 map_number=row["map_number"],
                 event_time=event_time,
                 team1_id=row["team1_id"],
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from collections.abc import Sequence
-from dataclasses import asdict, is_dataclass
+from dataclasses import fields, is_dataclass
 from typing import Any, cast
 
 from sqlalchemy.engine import Engine
@@ -30,11 +30,21 @@ _RANKING_FIELD_PAIRS = (
 )
 
 
+_EVENT_FIELD_NAMES: dict[type, tuple[str, ...]] = {}
+
+
+def _event_field_names(event_type: type) -> tuple[str, ...]:
+    names = _EVENT_FIELD_NAMES.get(event_type)
+    if names is None:
+        names = tuple(field.name for field in fields(event_type))
+        _EVENT_FIELD_NAMES[event_type] = names
+    return names
+
+
 def _to_event_payload(event: Any) -> dict[str, Any]:
-    if is_dataclass(event):
-        payload = asdict(event)
-        if isinstance(payload, dict):
-            return payload
+    if is_dataclass(event) and not isinstance(event, type):
+        # Event fields are flat scalars, so a shallow read avoids asdict's per-field deepcopy.
+        return {name: getattr(event, name) for name in _event_field_names(type(event))}
     if hasattr(event, "__dict__"):
         return dict(vars(event))
     raise TypeError(f"Unsupported event payload type: {type(event)!r}")
@@ -61,6 +61,31 @@ def test_map_update_is_zero_sum() -> None:
     assert team1_event.post_elo + team2_event.post_elo == pytest.approx(3000.0)
 
 
+def test_map_expected_scores_match_calculate_expected_score() -> None:
+    params = EloParameters(initial_elo=1500.0, k_factor=40.0, scale_factor=300.0)
+    calculator = TeamEloCalculator(params)
+    for map_id in (1, 2):
+        team1_event, team2_event = calculator.process_map(
+            TeamMapResult(
+                match_id=1,
+                map_id=map_id,
+                map_number=map_id,
+                event_time=datetime(2026, 1, 1, 12, 0, 0),
+                team1_id=100,
+                team2_id=200,
+                winner_id=100,
+            )
+        )
+
+    assert team1_event.pre_elo != team2_event.pre_elo
+    assert team1_event.expected_score == calculate_expected_score(
+        team1_event.pre_elo, team2_event.pre_elo, params.scale_factor
+    )
+    assert team2_event.expected_score == pytest.approx(
+        calculate_expected_score(team2_event.pre_elo, team1_event.pre_elo, params.scale_factor)
+    )
+
+
 def test_even_match_win_uses_default_multiplier() -> None:
     calculator = TeamEloCalculator(EloParameters(initial_elo=1500.0, k_factor=20.0))
     team1_event, _ = calculator.process_map(
@@ -498,6 +523,43 @@ def test_round_domination_multiplier_rewards_blowouts_more_than_close_wins() ->
     assert blowout_event.elo_delta > close_event.elo_delta
 
 
+def test_round_domination_multiplier_is_symmetric_in_winner_side() -> None:
+    calculator = TeamEloCalculator(
+        EloParameters(initial_elo=1500.0, k_factor=20.0, round_domination_multiplier=1.2)
+    )
+
+    team1_win_event, _ = calculator.process_map(
+        TeamMapResult(
+            match_id=1,
+            map_id=1,
+            map_number=1,
+            event_time=datetime(2026, 1, 1, 12, 0, 0),
+            team1_id=100,
+            team2_id=200,
+            winner_id=100,
+            team1_score=13,
+            team2_score=5,
+            match_format="BO1",
+        )
+    )
+    team2_win_event, _ = calculator.process_map(
+        TeamMapResult(
+            match_id=2,
+            map_id=2,
+            map_number=1,
+            event_time=datetime(2026, 1, 2, 12, 0, 0),
+            team1_id=300,
+            team2_id=400,
+            winner_id=400,
+            team1_score=5,
+            team2_score=13,
+            match_format="BO1",
+        )
+    )
+
+    assert team2_win_event.k_factor == pytest.approx(team1_win_event.k_factor)
+
+
 def test_round_domination_multiplier_has_no_effect_when_score_is_missing() -> None:
     baseline = TeamEloCalculator(EloParameters(initial_elo=1500.0, k_factor=20.0))
     boosted = TeamEloCalculator(
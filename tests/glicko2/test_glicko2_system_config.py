@@ -120,3 +120,4 @@ max_rd = 350.0
 
     with pytest.raises(ValueError, match=r"initial_rd must be between min_rd and max_rd"):
         load_glicko2_system_configs(tmp_path)
+
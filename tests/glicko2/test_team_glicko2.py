@@ -108,3 +108,45 @@ def test_glicko2_reference_example_matches_expected_values() -> None:
     assert rating == pytest.approx(1464.06, abs=0.1)
     assert rd == pytest.approx(151.52, abs=0.1)
     assert volatility == pytest.approx(0.05999, abs=1e-4)
+
+
+def test_rd_is_held_exactly_at_min_rd_floor() -> None:
+    params = Glicko2Parameters(min_rd=100.0)
+    calculator = TeamGlicko2Calculator(params)
+    event_time = datetime(2026, 1, 1, 12, 0, 0)
+
+    for map_id in range(1, 51):
+        team1_event, _ = calculator.process_map(
+            TeamMapResult(
+                match_id=map_id,
+                map_id=map_id,
+                map_number=1,
+                event_time=event_time,
+                team1_id=100,
+                team2_id=200,
+                winner_id=100 if map_id % 2 else 200,
+            )
+        )
+
+    assert team1_event.post_rd == params.min_rd
+    assert calculator.get_rd(100) == params.min_rd
+
+
+def test_new_team_reports_configured_initial_rd() -> None:
+    params = Glicko2Parameters(initial_rd=200.0)
+    calculator = TeamGlicko2Calculator(params)
+
+    assert calculator.get_rd(100) == params.initial_rd
+
+    team1_event, _ = calculator.process_map(
+        TeamMapResult(
+            match_id=1,
+            map_id=1,
+            map_number=1,
+            event_time=datetime(2026, 1, 1, 12, 0, 0),
+            team1_id=300,
+            team2_id=400,
+            winner_id=300,
+        )
+    )
+    assert team1_event.pre_rd == params.initial_rd
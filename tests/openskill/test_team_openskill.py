@@ -5,6 +5,7 @@ from __future__ import annotations
 from datetime import datetime
 
 import pytest
+from openskill.models import PlackettLuce
 
 from domain.common import TeamMapResult
 from domain.openskill.calculator import OpenSkillParameters, TeamOpenSkillCalculator
@@ -105,3 +106,37 @@ def test_invalid_map_with_same_teams_raises_error() -> None:
                 winner_id=100,
             )
         )
+
+
+def test_expected_scores_match_openskill_predict_win() -> None:
+    params = OpenSkillParameters(balance=True, limit_sigma=True)
+    calculator = TeamOpenSkillCalculator(params)
+    model = PlackettLuce(
+        mu=params.initial_mu,
+        sigma=params.initial_sigma,
+        beta=params.beta,
+        kappa=params.kappa,
+        tau=params.tau,
+        limit_sigma=params.limit_sigma,
+        balance=params.balance,
+    )
+
+    for map_id, winner_id in enumerate((100, 100, 200, 100, 200), start=1):
+        team1_rating = model.rating(mu=calculator.get_mu(100), sigma=calculator.get_sigma(100))
+        team2_rating = model.rating(mu=calculator.get_mu(200), sigma=calculator.get_sigma(200))
+        predicted = model.predict_win([[team1_rating], [team2_rating]])
+
+        event_a, event_b = calculator.process_map(
+            TeamMapResult(
+                match_id=1,
+                map_id=map_id,
+                map_number=map_id,
+                event_time=datetime(2026, 1, 1, 12, 0, 0),
+                team1_id=100,
+                team2_id=200,
+                winner_id=winner_id,
+            )
+        )
+
+        assert event_a.expected_score == pytest.approx(predicted[0], abs=1e-12)
+        assert event_b.expected_score == pytest.approx(predicted[1], abs=1e-12)
@@ -0,0 +1,58 @@
+"""Tests for the shared TOML config loader."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+from domain import config_base
+from domain.config_base import BaseSystemConfig, clear_config_cache, load_system_configs
+
+
+def _parse_system(raw: dict[str, Any], file_path: Path) -> BaseSystemConfig:
+    system = raw["system"]
+    return BaseSystemConfig(
+        name=system["name"],
+        description=system.get("description"),
+        file_path=file_path,
+        lookback_days=int(system["lookback_days"]),
+    )
+
+
+_TEMPLATE = """
+[system]
+name = "{name}"
+lookback_days = 365
+""".strip()
+
+
+def test_changed_config_file_is_reparsed(tmp_path: Path) -> None:
+    config_path = tmp_path / "cached.toml"
+    config_path.write_text(_TEMPLATE.format(name="first"))
+    assert load_system_configs(tmp_path, _parse_system)[0].name == "first"
+    assert load_system_configs(tmp_path, _parse_system)[0].name == "first"
+
+    config_path.write_text(_TEMPLATE.format(name="second_name"))
+    assert load_system_configs(tmp_path, _parse_system)[0].name == "second_name"
+
+
+def test_changed_config_file_replaces_its_cache_entry(tmp_path: Path) -> None:
+    clear_config_cache()
+    config_path = tmp_path / "cached.toml"
+    for name in ("first", "second_name", "third_longer_name"):
+        config_path.write_text(_TEMPLATE.format(name=name))
+        assert load_system_configs(tmp_path, _parse_system)[0].name == name
+
+    assert list(config_base._PARSE_CACHE) == [str(config_path)]
+
+
+def test_parser_mutating_raw_config_does_not_affect_later_loads(tmp_path: Path) -> None:
+    config_path = tmp_path / "mutated.toml"
+    config_path.write_text(_TEMPLATE.format(name="original"))
+
+    def mutating_parser(raw: dict[str, Any], file_path: Path) -> BaseSystemConfig:
+        raw["system"]["name"] = "corrupted"
+        return _parse_system(raw, file_path)
+
+    assert load_system_configs(tmp_path, mutating_parser)[0].name == "corrupted"
+    assert load_system_configs(tmp_path, _parse_system)[0].name == "original"